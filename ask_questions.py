@@ -7,6 +7,8 @@ Usage:
     python Tools/ask_questions.py --spec questions.yaml
     python Tools/ask_questions.py --spec questions.json
     cat questions.yaml | python Tools/ask_questions.py --spec -
+    python Tools/ask_questions.py --spec questions.yaml --stream
+    python Tools/ask_questions.py --spec specs/*.yaml --dry-run
     python Tools/ask_questions.py --schema --pretty
     python Tools/ask_questions.py --example yaml
 
@@ -222,37 +224,69 @@ Outputs JSON to stdout:
         }
 
 Note: multi_select questions return arrays; single-select questions return strings.
+
+With ``--stream``, each answer is written as its own JSON line as soon as it
+is given (e.g. ``{"my_question_key": "Option 1"}``) instead of one object at
+the end.
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
+import functools
 import json
-import platform
+import os
 import re
 import sys
+from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum, auto
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, NoReturn, Optional
 
-try:
-    import yaml
+if TYPE_CHECKING:
+    from prompt_toolkit.styles import Style
 
-    YAML_AVAILABLE = True
+try:
+    import orjson
 except ImportError:
-    YAML_AVAILABLE = False
+    orjson = None
 
-try:
-    import questionary
-    from questionary import Choice
-    from prompt_toolkit.styles import Style
-    from prompt_toolkit.input import create_input
-    from prompt_toolkit.output import create_output
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only
+# need to handle the stdlib exception.
+_json_loads = orjson.loads if orjson is not None else json.loads
 
-    QUESTIONARY_AVAILABLE = True
-except ImportError:
-    QUESTIONARY_AVAILABLE = False
+# First non-whitespace character of a JSON document, as text and as bytes;
+# kept apart so bytes are never compared with str (BytesWarning under -b).
+_JSON_START = ("{", "[")
+_JSON_START_BYTES = (b"{", b"[")
+
+# PyYAML and questionary (which pulls in prompt_toolkit) are imported on
+# first use, so --schema/--example/--help don't pay for loading them.
+_LAZY_MODULES: dict[str, Any] = {}
+
+
+def _get_yaml() -> Any:
+    """Return the PyYAML module, or None if it is not installed."""
+    if "yaml" not in _LAZY_MODULES:
+        try:
+            import yaml
+        except ImportError:
+            yaml = None
+        _LAZY_MODULES["yaml"] = yaml
+    return _LAZY_MODULES["yaml"]
+
+
+def _get_questionary() -> Any:
+    """Return the questionary module, or None if it is not installed."""
+    if "questionary" not in _LAZY_MODULES:
+        try:
+            import questionary
+        except ImportError:
+            questionary = None
+        _LAZY_MODULES["questionary"] = questionary
+    return _LAZY_MODULES["questionary"]
 
 
 # Type-safe sentinel for freeform input
@@ -279,11 +313,19 @@ EXIT_SUCCESS = 0
 EXIT_ERROR = 1
 EXIT_CANCELLED = 130
 
+# Terminal device used for prompting when stdin carries the spec
+_TTY_DEVICE = "CON" if sys.platform == "win32" else "/dev/tty"
+
 # Key validation pattern
 KEY_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 
+# Generated output keys for questions without an explicit key
+_DEFAULT_KEYS = tuple(f"question_{i}" for i in range(MAX_QUESTIONS))
 
+
+@functools.lru_cache(maxsize=1)
 def get_example_spec() -> dict[str, Any]:
+    # The result is cached and shared between callers; treat it as read-only.
     return {
         "questions": [
             {
@@ -328,49 +370,54 @@ def get_example_spec() -> dict[str, Any]:
     }
 
 
+# Hand-authored YAML to avoid depending on PyYAML for printing examples.
+_EXAMPLE_YAML = """\
+questions:
+  - question: "Pick an option"
+    options:
+      - value: "Option 1"
+        description: "A predefined choice"
+      - value: "Option 2"
+        description: "Another predefined choice"
+    key: choice
+  - question: "Pick or type your own"
+    options:
+      - value: "A"
+        description: "Short"
+      - value: "B"
+        description: "Also short"
+    allow_freeform: true
+    freeform_label: "Other (type your own)"
+    key: choice_or_freeform
+  - question: "Which features do you want?"
+    options:
+      - value: "Feature A"
+        description: "First feature"
+      - value: "Feature B"
+        description: "Second feature"
+      - value: "Feature C"
+        description: "Third feature"
+    multi_select: true
+    allow_freeform: true
+    freeform_label: "Other (type your own)"
+    key: features
+  - question: "Any comments?"
+    options: []
+    # allow_freeform omitted -> defaults to true when options is empty
+    key: comments
+"""
+
+
 def get_example_yaml() -> str:
-    # Hand-authored YAML to avoid depending on PyYAML for printing examples.
-    return (
-        "questions:\n"
-        '  - question: "Pick an option"\n'
-        "    options:\n"
-        '      - value: "Option 1"\n'
-        '        description: "A predefined choice"\n'
-        '      - value: "Option 2"\n'
-        '        description: "Another predefined choice"\n'
-        "    key: choice\n"
-        '  - question: "Pick or type your own"\n'
-        "    options:\n"
-        '      - value: "A"\n'
-        '        description: "Short"\n'
-        '      - value: "B"\n'
-        '        description: "Also short"\n'
-        "    allow_freeform: true\n"
-        '    freeform_label: "Other (type your own)"\n'
-        "    key: choice_or_freeform\n"
-        '  - question: "Which features do you want?"\n'
-        "    options:\n"
-        '      - value: "Feature A"\n'
-        '        description: "First feature"\n'
-        '      - value: "Feature B"\n'
-        '        description: "Second feature"\n'
-        '      - value: "Feature C"\n'
-        '        description: "Third feature"\n'
-        "    multi_select: true\n"
-        "    allow_freeform: true\n"
-        '    freeform_label: "Other (type your own)"\n'
-        "    key: features\n"
-        '  - question: "Any comments?"\n'
-        "    options: []\n"
-        "    # allow_freeform omitted -> defaults to true when options is empty\n"
-        "    key: comments\n"
-    )
+    return _EXAMPLE_YAML
 
 
+@functools.lru_cache(maxsize=1)
 def get_spec_json_schema() -> dict[str, Any]:
     # Notes:
     # - This schema focuses on structure and basic constraints.
     # - It cannot express key uniqueness or generated-key collision rules.
+    # - The result is cached and shared between callers; treat it as read-only.
     question_schema: dict[str, Any] = {
         "type": "object",
         "required": ["question"],
@@ -469,7 +516,7 @@ class SpecError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QuestionOption:
     """Represents an answer option for a question."""
 
@@ -477,7 +524,7 @@ class QuestionOption:
     description: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Question:
     """Represents a question with multiple choice options."""
 
@@ -495,7 +542,7 @@ def get_custom_style() -> Style:
     Returns:
         Style object for questionary prompts
     """
-    return Style(
+    return _get_questionary().Style(
         [
             ("qmark", "fg:#673ab7 bold"),  # Question mark
             ("question", "bold"),  # Question text
@@ -508,7 +555,10 @@ def get_custom_style() -> Style:
 
 
 def ask_questions(
-    questions: list[Question], prompt_input=None, prompt_output=None
+    questions: list[Question],
+    prompt_input=None,
+    prompt_output=None,
+    on_answer: Callable[[str, str | list[str]], None] | None = None,
 ) -> tuple[dict[str, str | list[str]], bool]:
     """
     Asks a series of questions and collects answers from the user.
@@ -521,6 +571,8 @@ def ask_questions(
         questions: List of Question objects to ask
         prompt_input: prompt_toolkit Input object for reading user input (defaults to stdin)
         prompt_output: prompt_toolkit Output object for writing output (defaults to stdout)
+        on_answer: Optional callback invoked with (key, answer) as soon as each
+            question is answered, e.g. to stream answers downstream
 
     Returns:
         Tuple of (answers dict, was_cancelled bool)
@@ -531,7 +583,8 @@ def ask_questions(
     Raises:
         ValueError: If questionary is not installed
     """
-    if not QUESTIONARY_AVAILABLE:
+    questionary = _get_questionary()
+    if questionary is None:
         raise ValueError(
             "questionary not installed. Install with: pip install questionary"
         )
@@ -539,23 +592,53 @@ def ask_questions(
     answers: dict[str, str | list[str]] = {}
     custom_style = get_custom_style()
 
+    def record(key: str, answer: str | list[str]) -> None:
+        answers[key] = answer
+        if on_answer is not None:
+            on_answer(key, answer)
+
+    # Prompt settings that don't depend on the question are built once.
+    io_kwargs = {}
+    if prompt_input is not None:
+        io_kwargs["input"] = prompt_input
+    if prompt_output is not None:
+        io_kwargs["output"] = prompt_output
+
+    checkbox_settings = {
+        "instruction": "(Space to select, Enter to confirm)",
+        "pointer": "›",
+        "style": custom_style,
+        **io_kwargs,
+    }
+    select_settings = {
+        "use_shortcuts": False,  # Disable letter shortcuts
+        "use_arrow_keys": True,
+        "instruction": "",  # Remove instruction text
+        "pointer": "›",  # Use a smaller pointer symbol
+        "use_indicator": False,  # Disable indicator
+        "style": custom_style,  # Apply custom styling
+        **io_kwargs,
+    }
+
     # Ask each question sequentially
     for i, q in enumerate(questions):
-        key = q.key if q.key else f"question_{i}"
+        if q.key:
+            key = q.key
+        elif i < MAX_QUESTIONS:
+            key = _DEFAULT_KEYS[i]
+        else:  # Question lists built by hand may exceed the spec limit
+            key = f"question_{i}"
 
         # Special case: no options, only freeform input
         # Skip the select menu and go directly to text input
         if len(q.options) == 0 and q.allow_freeform:
             try:
-                text_kwargs = {"message": q.question}
-                if prompt_input is not None:
-                    text_kwargs["input"] = prompt_input
-                if prompt_output is not None:
-                    text_kwargs["output"] = prompt_output
-                freeform_answer = questionary.text(**text_kwargs).ask()
+                freeform_answer = questionary.text(
+                    message=q.question, **io_kwargs
+                ).ask()
                 if freeform_answer is None:  # User cancelled
                     return answers, True
-                answers[key] = freeform_answer
+                record(key, freeform_answer)
                 continue  # Move to next question
             except (KeyboardInterrupt, EOFError):
                 return answers, True
@@ -569,7 +652,7 @@ def ask_questions(
             if description:
                 title.append(("class:description", f"\n    {description}"))
             choices.append(
-                Choice(
+                questionary.Choice(
                     title=title,
                     value=option.value,
                 )
@@ -578,7 +661,7 @@ def ask_questions(
         # Add freeform option if allowed
         if q.allow_freeform:
             choices.append(
-                Choice(
+                questionary.Choice(
                     title=[
                         ("class:highlighted", q.freeform_label),
                     ],
@@ -589,19 +672,9 @@ def ask_questions(
         # Handle multiselect questions with checkbox
         if q.multi_select:
             try:
-                checkbox_kwargs = {
-                    "message": q.question,
-                    "choices": choices,
-                    "instruction": "(Space to select, Enter to confirm)",
-                    "pointer": "›",
-                    "style": custom_style,
-                }
-                if prompt_input is not None:
-                    checkbox_kwargs["input"] = prompt_input
-                if prompt_output is not None:
-                    checkbox_kwargs["output"] = prompt_output
-
-                selected_values = questionary.checkbox(**checkbox_kwargs).ask()
+                selected_values = questionary.checkbox(
+                    message=q.question, choices=choices, **checkbox_settings
+                ).ask()
 
                 # Handle cancellation (Ctrl+C)
                 if selected_values is None:
@@ -612,12 +685,9 @@ def ask_questions(
                 for val in selected_values:
                     if val is _FREEFORM_SENTINEL:
                         # Ask for freeform input
-                        text_kwargs = {"message": "Enter your custom value:"}
-                        if prompt_input is not None:
-                            text_kwargs["input"] = prompt_input
-                        if prompt_output is not None:
-                            text_kwargs["output"] = prompt_output
-                        freeform_answer = questionary.text(**text_kwargs).ask()
+                        freeform_answer = questionary.text(
+                            message="Enter your custom value:", **io_kwargs
+                        ).ask()
                         if freeform_answer is None:  # User cancelled
                             return answers, True
                         if freeform_answer:  # Only add non-empty freeform
@@ -625,7 +695,7 @@ def ask_questions(
                     elif isinstance(val, str):
                         result_values.append(val)
 
-                answers[key] = result_values
+                record(key, result_values)
                 continue  # Move to next question
 
             except (KeyboardInterrupt, EOFError):
@@ -633,22 +703,9 @@ def ask_questions(
 
         # Use questionary select to present the question (single-select)
         try:
-            question_kwargs = {
-                "message": q.question,
-                "choices": choices,
-                "use_shortcuts": False,  # Disable letter shortcuts
-                "use_arrow_keys": True,
-                "instruction": "",  # Remove instruction text
-                "pointer": "›",  # Use a smaller pointer symbol
-                "use_indicator": False,  # Disable indicator
-                "style": custom_style,  # Apply custom styling
-            }
-            if prompt_input is not None:
-                question_kwargs["input"] = prompt_input
-            if prompt_output is not None:
-                question_kwargs["output"] = prompt_output
-
-            selected_value = questionary.select(**question_kwargs).ask()
+            selected_value = questionary.select(
+                message=q.question, choices=choices, **select_settings
+            ).ask()
 
             # Handle cancellation (Ctrl+C)
             if selected_value is None:
@@ -656,18 +713,15 @@ def ask_questions(
 
             # If user selected freeform option, ask for text input
             if selected_value is _FREEFORM_SENTINEL and q.allow_freeform:
-                text_kwargs = {"message": f"Enter your answer:"}
-                if prompt_input is not None:
-                    text_kwargs["input"] = prompt_input
-                if prompt_output is not None:
-                    text_kwargs["output"] = prompt_output
-                freeform_answer = questionary.text(**text_kwargs).ask()
+                freeform_answer = questionary.text(
+                    message="Enter your answer:", **io_kwargs
+                ).ask()
                 if freeform_answer is None:  # User cancelled
                     return answers, True
-                answers[key] = freeform_answer
+                record(key, freeform_answer)
             elif isinstance(selected_value, str):
                 # Type guard to ensure only strings are assigned
-                answers[key] = selected_value
+                record(key, selected_value)
 
         except (KeyboardInterrupt, EOFError):
             # User cancelled, return what we have so far
@@ -676,11 +730,11 @@ def ask_questions(
     return answers, False
 
 
-def parse_spec_content(content: str, source: str) -> dict[str, Any]:
+def parse_spec_content(content: str | bytes, source: str) -> dict[str, Any]:
     """Parse spec content as JSON or YAML.
 
     Args:
-        content: The spec content as a string
+        content: The spec content as a string or UTF-8 encoded bytes
         source: Description of the source (for error messages)
 
     Returns:
@@ -689,23 +743,35 @@ def parse_spec_content(content: str, source: str) -> dict[str, Any]:
     Raises:
         SpecError: If content cannot be parsed as JSON or YAML
     """
-    # Try JSON first
+    json_error: ValueError | None = None
+
+    # Only try JSON when the content looks like a JSON document; plain YAML
+    # goes straight to the YAML parser instead of failing a full JSON pass.
+    json_start = _JSON_START_BYTES if isinstance(content, bytes) else _JSON_START
+    if content.lstrip()[:1] in json_start or _get_yaml() is None:
+        try:
+            return _json_loads(content)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            if _get_yaml() is None:
+                raise SpecError(f"Could not parse {source} as JSON: {e}")
+            json_error = e
+
+    yaml = _get_yaml()
+    # Prefer the libyaml-backed loader; fall back to the pure-Python one.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
-        return json.loads(content)
-    except json.JSONDecodeError as json_error:
-        if YAML_AVAILABLE:
-            try:
-                return yaml.safe_load(content)
-            except yaml.YAMLError as yaml_error:
-                error_msg = f"Could not parse {source} as JSON or YAML.\n"
-                error_msg += f"JSON error: {json_error}\n"
-                error_msg += f"YAML error: {yaml_error}"
-                if hasattr(yaml_error, "problem_mark"):
-                    mark = yaml_error.problem_mark  # type: ignore
-                    error_msg += f"\nYAML error at line {mark.line + 1}, column {mark.column + 1}"
-                raise SpecError(error_msg)
+        return yaml.load(content, Loader=loader)
+    except yaml.YAMLError as yaml_error:
+        if json_error is not None:
+            error_msg = f"Could not parse {source} as JSON or YAML.\n"
+            error_msg += f"JSON error: {json_error}\n"
         else:
-            raise SpecError(f"Could not parse {source} as JSON: {json_error}")
+            error_msg = f"Could not parse {source} as YAML.\n"
+        error_msg += f"YAML error: {yaml_error}"
+        if hasattr(yaml_error, "problem_mark"):
+            mark = yaml_error.problem_mark  # type: ignore
+            error_msg += f"\nYAML error at line {mark.line + 1}, column {mark.column + 1}"
+        raise SpecError(error_msg)
 
 
 def load_spec_from_file(file_path: str) -> dict[str, Any]:
@@ -726,13 +792,13 @@ def load_spec_from_file(file_path: str) -> dict[str, Any]:
         raise SpecError(f"File not found: {file_path}")
 
     try:
-        content = path.read_text(encoding="utf-8")
+        content = path.read_bytes()
     except OSError as e:
         raise SpecError(f"Failed to read file {file_path}: {e}")
 
     # Check for YAML-only file extensions
     if file_path.endswith((".yaml", ".yml")):
-        if not YAML_AVAILABLE:
+        if _get_yaml() is None:
             raise SpecError("PyYAML not installed. Install with: pip install pyyaml")
 
     return parse_spec_content(content, file_path)
@@ -747,7 +813,8 @@ def load_spec_from_stdin() -> dict[str, Any]:
     Raises:
         SpecError: If stdin is empty or content cannot be parsed
     """
-    content = sys.stdin.read()
+    # Read the raw bytes in one go; both parsers accept UTF-8 bytes directly.
+    content = sys.stdin.buffer.read()
 
     if not content.strip():
         raise SpecError("No input provided on stdin")
@@ -782,6 +849,9 @@ def parse_spec(spec: dict[str, Any]) -> list[Question]:
 
     questions: list[Question] = []
     seen_keys: set[str] = set()
+    # Share one string object per distinct option value/description/label;
+    # generated specs often repeat the same vocabulary across questions.
+    interned: dict[str, str] = {}
 
     for i, q_dict in enumerate(questions_data):
         try:
@@ -840,8 +910,8 @@ def parse_spec(spec: dict[str, Any]) -> list[Question]:
 
                 options.append(
                     QuestionOption(
-                        value=option_value,
-                        description=description,
+                        value=interned.setdefault(option_value, option_value),
+                        description=interned.setdefault(description, description),
                     )
                 )
 
@@ -865,11 +935,13 @@ def parse_spec(spec: dict[str, Any]) -> list[Question]:
 
             # Get and validate custom freeform label if provided
             freeform_label = q_dict.get("freeform_label", DEFAULT_FREEFORM_LABEL)
-            if not isinstance(freeform_label, str) or not freeform_label.strip():
+            if isinstance(freeform_label, str):
+                freeform_label = freeform_label.strip()
+            if not isinstance(freeform_label, str) or not freeform_label:
                 raise SpecError(
                     f"'freeform_label' must be a non-empty string in question {i}"
                 )
-            freeform_label = freeform_label.strip()
+            freeform_label = interned.setdefault(freeform_label, freeform_label)
 
             # Validate multi_select
             multi_select = q_dict.get("multi_select", False)
@@ -891,26 +963,30 @@ def parse_spec(spec: dict[str, Any]) -> list[Question]:
             if key is not None:
                 if not isinstance(key, str):
                     raise SpecError(f"'key' must be a string in question {i}")
-                if not KEY_PATTERN.match(key):
+                # Same rule as KEY_PATTERN: an ASCII-only identifier.
+                if not (key.isascii() and key.isidentifier()):
                     raise SpecError(
                         f"Invalid key '{key}' in question {i}. Must be a valid identifier "
                         f"(letters/numbers/underscore, starting with a letter or underscore)."
                     )
-                if key in seen_keys:
+                # Insert and detect duplicates with a single hash lookup
+                seen_count = len(seen_keys)
+                seen_keys.add(key)
+                if len(seen_keys) == seen_count:
                     raise SpecError(
                         f"Duplicate key '{key}' found in question {i}. "
                         f"Fix: keys must be unique across questions."
                     )
-                seen_keys.add(key)
             else:
                 # Generate default key and check for collision
-                default_key = f"question_{i}"
-                if default_key in seen_keys:
+                default_key = _DEFAULT_KEYS[i]
+                seen_count = len(seen_keys)
+                seen_keys.add(default_key)
+                if len(seen_keys) == seen_count:
                     raise SpecError(
                         f"Generated key '{default_key}' conflicts with explicit key. "
                         f"Fix: rename your explicit key(s) to avoid 'question_N' or provide keys for all questions."
                     )
-                seen_keys.add(default_key)
 
             # Create Question object
             question = Question(
@@ -928,7 +1004,132 @@ def parse_spec(spec: dict[str, Any]) -> list[Question]:
     return questions
 
 
+def _dump_json(obj: Any, pretty: bool) -> bytes | str:
+    """Serialize obj to JSON terminated by a newline.
+
+    Without orjson this is the str json.dumps has always produced (ASCII-escaped,
+    default separators). With orjson installed it is orjson's UTF-8 bytes,
+    which are compact (no spaces after ':' and ',') and not ASCII-escaped.
+    """
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2) + "\n"
+    return json.dumps(obj) + "\n"
+
+
+def _write_stdout(data: bytes | str) -> None:
+    """Write data to stdout in a single call and flush.
+
+    Text goes through sys.stdout like print() does; bytes go straight to the
+    underlying binary buffer.
+    """
+    if isinstance(data, bytes):
+        sys.stdout.buffer.write(data)
+    else:
+        sys.stdout.write(data)
+    sys.stdout.flush()
+
+
+def _emit_json(obj: Any, pretty: bool) -> None:
+    """Write obj to stdout as JSON followed by a newline, in a single write."""
+    _write_stdout(_dump_json(obj, pretty))
+
+
+@functools.lru_cache(maxsize=2)
+def _schema_json(pretty: bool) -> bytes | str:
+    """Serialized JSON Schema (with trailing newline), cached per style."""
+    return _dump_json(get_spec_json_schema(), pretty)
+
+
+@contextlib.contextmanager
+def _open_tty(tty_device: str):
+    """Open the terminal device for prompting.
+
+    Yields:
+        Tuple of (input file, output file) for the terminal
+    """
+    if sys.platform == "win32":
+        # The Windows console hands out separate input and output handles.
+        with open(tty_device, "r", encoding="utf-8") as tty_input_file, open(
+            tty_device, "w", encoding="utf-8"
+        ) as tty_output_file:
+            yield tty_input_file, tty_output_file
+        return
+
+    # One read/write descriptor serves both directions; the file objects
+    # are views on it and leave closing to us.
+    fd = os.open(tty_device, os.O_RDWR)
+    try:
+        tty_input_file = os.fdopen(fd, "r", encoding="utf-8", closefd=False)
+        tty_output_file = os.fdopen(fd, "w", encoding="utf-8", closefd=False)
+        with tty_input_file, tty_output_file:
+            yield tty_input_file, tty_output_file
+    finally:
+        os.close(fd)
+
+
+def _stream_answer(key: str, answer: str | list[str]) -> None:
+    """Write a single answer to stdout as one JSON line."""
+    _emit_json({key: answer}, pretty=False)
+
+
+def _exit_broken_pipe() -> NoReturn:
+    """Exit quietly once the reader of stdout has closed the pipe."""
+    # Point stdout at devnull so the final flush at interpreter exit does not
+    # hit the closed pipe again and print a second error.
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+    os.close(devnull)
+    sys.exit(EXIT_ERROR)
+
+
+def _load_questions(spec_source: str) -> list[Question]:
+    """Load and parse a spec from a file path, or from stdin if "-".
+
+    Raises:
+        SpecError: If the spec cannot be loaded or is invalid
+    """
+    if spec_source == "-":
+        spec = load_spec_from_stdin()
+    else:
+        spec = load_spec_from_file(spec_source)
+
+    questions = parse_spec(spec)
+
+    if not questions:
+        raise SpecError("No questions found in spec")
+
+    return questions
+
+
+def _print_schema(pretty: bool) -> None:
+    """Write the spec JSON Schema to stdout."""
+    _write_stdout(_schema_json(pretty))
+
+
+def _print_example(example_format: str, pretty: bool) -> None:
+    """Write the example spec to stdout as "yaml" or "json"."""
+    if example_format == "yaml":
+        _write_stdout(get_example_yaml())
+    else:
+        _emit_json(get_example_spec(), pretty)
+
+
 def main():
+    # Fast path for the fixed-output invocations used by build tooling:
+    # answer them without constructing the argument parser.
+    argv = sys.argv[1:]
+    if argv in (["--schema"], ["--schema", "--pretty"], ["--pretty", "--schema"]):
+        _print_schema("--pretty" in argv)
+        sys.exit(EXIT_SUCCESS)
+    if argv == ["--example", "yaml"]:
+        _print_example("yaml", pretty=False)
+        sys.exit(EXIT_SUCCESS)
+
     parser = argparse.ArgumentParser(
         description="Ask questions from a spec file and output answers as JSON",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -938,7 +1139,9 @@ def main():
     mode_group = parser.add_mutually_exclusive_group(required=True)
     mode_group.add_argument(
         "--spec",
-        help="Path to question spec file (JSON or YAML), or '-' to read from stdin",
+        nargs="+",
+        help="Path to question spec file (JSON or YAML), or '-' to read from stdin. "
+        "Several specs may be given together with --dry-run",
     )
     mode_group.add_argument(
         "--schema",
@@ -959,6 +1162,12 @@ def main():
         "--dry-run", action="store_true", help="Validate spec without asking questions"
     )
 
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write each answer as a JSON line as soon as it is given",
+    )
+
     args = parser.parse_args()
 
     # Helper functions are defined at module scope for reuse/testing.
@@ -966,37 +1175,43 @@ def main():
     if args.dry_run and (args.schema or args.example is not None):
         parser.error("--dry-run can only be used together with --spec")
 
+    if args.stream and args.pretty:
+        parser.error("--stream cannot be combined with --pretty")
+
+    if args.spec is not None and len(args.spec) > 1 and not args.dry_run:
+        parser.error("multiple --spec files can only be used together with --dry-run")
+
+    if args.spec is not None and args.spec.count("-") > 1:
+        parser.error("stdin ('-') can only be given once to --spec")
+
     if args.schema:
-        schema = get_spec_json_schema()
-        if args.pretty:
-            print(json.dumps(schema, indent=2))
-        else:
-            print(json.dumps(schema))
+        _print_schema(args.pretty)
         sys.exit(EXIT_SUCCESS)
 
     if args.example is not None:
-        if args.example == "yaml":
-            print(get_example_yaml(), end="")
-        else:
-            example = get_example_spec()
-            if args.pretty:
-                print(json.dumps(example, indent=2))
-            else:
-                print(json.dumps(example))
+        _print_example(args.example, args.pretty)
         sys.exit(EXIT_SUCCESS)
 
-    try:
-        # Load spec
-        if args.spec == "-":
-            spec = load_spec_from_stdin()
-        else:
-            spec = load_spec_from_file(args.spec)
+    if len(args.spec) > 1:
+        # Batch dry-run: validate every spec in this process, report each one
+        failed = False
+        for spec_source in args.spec:
+            try:
+                questions = _load_questions(spec_source)
+            except SpecError as e:
+                print(f"{spec_source}: Error: {e}", file=sys.stderr)
+                failed = True
+            else:
+                print(
+                    f"{spec_source}: Valid spec with {len(questions)} questions",
+                    file=sys.stderr,
+                )
+        sys.exit(EXIT_ERROR if failed else EXIT_SUCCESS)
 
-        # Parse questions
-        questions = parse_spec(spec)
+    spec_source = args.spec[0]
 
-        if not questions:
-            raise SpecError("No questions found in spec")
+    try:
+        questions = _load_questions(spec_source)
 
         # Dry-run mode: validate and exit
         if args.dry_run:
@@ -1007,43 +1222,51 @@ def main():
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(EXIT_ERROR)
 
-    # Determine TTY device based on platform
-    if platform.system() == "Windows":
-        tty_device = "CON"
-    else:
-        tty_device = "/dev/tty"
+    # In streaming mode each answer is written as soon as it is given
+    on_answer = _stream_answer if args.stream else None
+
+    # Probe fd 0 directly rather than through the sys.stdin wrapper; only the
+    # interactive path needs to know, so the early exits above skip it.
+    stdin_is_tty = os.isatty(0)
 
     # Ask questions with proper resource management
     try:
-        if args.spec == "-" or not sys.stdin.isatty():
-            # Reading spec from stdin OR running without a TTY on stdin:
-            # use the controlling terminal device for interactive input.
-            try:
-                with open(tty_device, "r", encoding="utf-8") as tty_input_file, open(
-                    tty_device, "w", encoding="utf-8"
-                ) as tty_output_file:
-                    prompt_input = create_input(stdin=tty_input_file)
-                    prompt_output = create_output(stdout=tty_output_file)
-                    answers, was_cancelled = ask_questions(
-                        questions,
-                        prompt_input=prompt_input,
-                        prompt_output=prompt_output,
+        with contextlib.ExitStack() as stack:
+            prompt_io = {}
+            if spec_source == "-" or not stdin_is_tty:
+                # Reading spec from stdin OR running without a TTY on stdin:
+                # use the controlling terminal device for interactive input.
+                from prompt_toolkit.input import create_input
+                from prompt_toolkit.output import create_output
+
+                try:
+                    tty_input_file, tty_output_file = stack.enter_context(
+                        _open_tty(_TTY_DEVICE)
                     )
-            except OSError as e:
-                print(
-                    f"Error: Cannot open {tty_device} for interactive input: {e}",
-                    file=sys.stderr,
-                )
-                print(
-                    "This script requires an interactive terminal (TTY) for prompting",
-                    file=sys.stderr,
-                )
-                sys.exit(EXIT_ERROR)
-        else:
-            # Interactive stdin is available; let questionary use defaults.
-            answers, was_cancelled = ask_questions(questions)
+                except OSError as e:
+                    print(
+                        f"Error: Cannot open {_TTY_DEVICE} for interactive input: {e}",
+                        file=sys.stderr,
+                    )
+                    print(
+                        "This script requires an interactive terminal (TTY) for prompting",
+                        file=sys.stderr,
+                    )
+                    sys.exit(EXIT_ERROR)
+                prompt_io = {
+                    "prompt_input": create_input(stdin=tty_input_file),
+                    "prompt_output": create_output(stdout=tty_output_file),
+                }
+            # Otherwise interactive stdin is available; let questionary use
+            # its defaults.
+            answers, was_cancelled = ask_questions(
+                questions, on_answer=on_answer, **prompt_io
+            )
 
-    except ValueError as e:
+    except BrokenPipeError:
+        # The reader of a streamed answer went away (e.g. ``--stream | head -1``)
+        _exit_broken_pipe()
+    except (ValueError, ImportError) as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(EXIT_ERROR)
     except (KeyboardInterrupt, EOFError):
@@ -1055,11 +1278,12 @@ def main():
         print("\nCancelled by user", file=sys.stderr)
         sys.exit(EXIT_CANCELLED)
 
-    # Output answers as JSON
-    if args.pretty:
-        print(json.dumps(answers, indent=2))
-    else:
-        print(json.dumps(answers))
+    # Output answers as JSON (already written line by line when streaming)
+    if not args.stream:
+        try:
+            _emit_json(answers, args.pretty)
+        except BrokenPipeError:
+            _exit_broken_pipe()
 
 
 if __name__ == "__main__":
@@ -1,199 +1,285 @@
-#!/usr/bin/env python3
 """Test suite for ask_questions.py
 
 Tests spec parsing, validation, and key generation.
-Run with: python3 test_ask_questions.py
+Run with: pytest (add -n auto to run in parallel via pytest-xdist)
 """
 
+import contextlib
 import json
+import os
+import re
+import subprocess
 import sys
-import tempfile
-from pathlib import Path
+import types
+
+import pytest
+
+try:
+    import yaml  # noqa: F401
+
+    _HAS_YAML = True
+except ImportError:
+    _HAS_YAML = False
 
 # Import the module to test
 from ask_questions import (
     SpecError,
     Question,
     QuestionOption,
+    _LAZY_MODULES,
+    _dump_json,
+    _schema_json,
+    ask_questions,
+    main,
     parse_spec,
     parse_spec_content,
     load_spec_from_file,
     get_spec_json_schema,
+    get_example_spec,
+    get_example_yaml,
     MAX_QUESTION_LENGTH,
     MAX_OPTION_LENGTH,
     MAX_QUESTIONS,
     MIN_MULTISELECT_OPTIONS,
     MAX_MULTISELECT_OPTIONS,
     KEY_PATTERN,
+    DEFAULT_FREEFORM_LABEL,
 )
 
 
-class SimpleTestRunner:
-    """Simple test runner without external dependencies."""
+requires_yaml = pytest.mark.skipif(not _HAS_YAML, reason="PyYAML not installed")
 
-    def __init__(self):
-        self.passed = 0
-        self.failed = 0
-        self.tests = []
+# Oversized inputs for the limit checks, built once at import.
+_TOO_MANY_QUESTIONS = [
+    {"question": f"Q{i}?", "options": [{"value": "a"}]}
+    for i in range(MAX_QUESTIONS + 1)
+]
+_TOO_MANY_OPTIONS = [{"value": f"opt{i}"} for i in range(MAX_MULTISELECT_OPTIONS + 1)]
 
-    def test(self, name):
-        """Decorator to register a test."""
 
-        def decorator(func):
-            self.tests.append((name, func))
-            return func
-
-        return decorator
+# Realistic specs shared by the parse tests; parse_spec never mutates them.
+_COMPLEX_SPEC = {
+    "questions": [
+        {
+            "question": "What is your favorite color?",
+            "options": [
+                {"value": "Red", "description": "The color of passion"},
+                {"value": "Blue", "description": "The color of calm"},
+                {"value": "Green", "description": "The color of nature"},
+            ],
+            "allow_freeform": True,
+            "freeform_label": "Other color",
+            "key": "favorite_color",
+        },
+        {
+            "question": "How many hours do you sleep?",
+            "options": [
+                {"value": "< 6 hours"},
+                {"value": "6-8 hours"},
+                {"value": "> 8 hours"},
+            ],
+        },
+        {
+            "question": "Any comments?",
+            "options": [],
+        },  # allow_freeform defaults to True
+    ]
+}
 
-    def run(self):
-        """Run all registered tests."""
-        print(f"Running {len(self.tests)} tests...\n")
+_MIXED_FREEFORM_SPEC = {
+    "questions": [
+        {
+            "question": "Comment?",
+            "options": [],
+        },  # allow_freeform defaults to True
+        {
+            "question": "Choose?",
+            "options": [{"value": "a"}, {"value": "b"}],
+        },  # allow_freeform defaults to False
+        {
+            "question": "Another comment?",
+            "options": [],
+            "key": "comment2",
+        },  # allow_freeform defaults to True
+    ]
+}
 
-        for name, func in self.tests:
-            try:
-                func()
-                self.passed += 1
-                print(f"? {name}")
-            except AssertionError as e:
-                self.failed += 1
-                print(f"? {name}")
-                print(f"  {e}")
-            except Exception as e:
-                self.failed += 1
-                print(f"? {name} (unexpected error)")
-                print(f"  {type(e).__name__}: {e}")
+_MIXED_SELECT_SPEC = {
+    "questions": [
+        {
+            "question": "Single select?",
+            "options": [{"value": "a"}],
+            "key": "single",
+        },
+        {
+            "question": "Multi select?",
+            "options": [{"value": "x"}, {"value": "y"}, {"value": "z"}],
+            "multi_select": True,
+            "allow_freeform": True,
+            "key": "multi",
+        },
+        {
+            "question": "Freeform only?",
+            "options": [],
+            "key": "freeform",
+        },
+    ]
+}
 
-        print(f"\n{'=' * 60}")
-        print(f"Results: {self.passed} passed, {self.failed} failed")
-        print("=" * 60)
 
-        return 0 if self.failed == 0 else 1
+# Parsed valid specs, built fresh for each test: Question is frozen but its
+# options list is not, so a shared instance could leak mutations.
+@pytest.fixture
+def minimal_questions():
+    """One single-select question with a single option."""
+    return parse_spec(
+        {"questions": [{"question": "Test?", "options": [{"value": "yes"}]}]}
+    )
 
 
-# Create test runner
-runner = SimpleTestRunner()
+@pytest.fixture
+def freeform_only_questions():
+    """One freeform-only question with no options."""
+    return parse_spec(
+        {"questions": [{"question": "Test?", "options": [], "allow_freeform": True}]}
+    )
 
 
 # Tests for parse_spec_content
-@runner.test("parse_spec_content: Valid JSON")
 def test_parse_spec_content_json():
+    """parse_spec_content: Valid JSON"""
     spec = parse_spec_content('{"test": "value"}', "test")
     assert spec == {"test": "value"}, f"Expected dict, got {spec}"
 
 
-@runner.test("parse_spec_content: Valid YAML")
-def test_parse_spec_content_yaml():
-    try:
-        spec = parse_spec_content("test: value", "test")
-        assert spec == {"test": "value"}, f"Expected dict, got {spec}"
-    except SpecError as e:
-        # YAML might not be available
-        if "pyyaml" not in str(e).lower():
-            raise
-
-
-@runner.test("parse_spec_content: Invalid content")
-def test_parse_spec_content_invalid():
-    try:
-        parse_spec_content("{invalid json", "test")
-        raise AssertionError("Should have raised SpecError")
-    except SpecError:
-        pass  # Expected
-
-
-# Tests for parse_spec validation
-@runner.test("parse_spec: Missing 'questions' key")
-def test_parse_spec_no_questions():
-    try:
-        parse_spec({"other": "data"})
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "questions" in str(e).lower()
-
-
-@runner.test("parse_spec: 'questions' not a list")
-def test_parse_spec_questions_not_list():
-    try:
-        parse_spec({"questions": "not a list"})
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "list" in str(e).lower()
-
-
-@runner.test("parse_spec: Missing question text")
-def test_parse_spec_missing_question():
-    try:
-        parse_spec({"questions": [{"options": [{"value": "yes"}]}]})
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "question" in str(e).lower()
+def test_parse_spec_content_json_bytes():
+    """parse_spec_content: Valid JSON bytes"""
+    spec = parse_spec_content('{"test": "välue"}'.encode(), "test")
+    assert spec == {"test": "välue"}, f"Expected dict, got {spec}"
 
 
-@runner.test("parse_spec: Empty question text")
-def test_parse_spec_empty_question():
-    try:
-        parse_spec({"questions": [{"question": "", "options": [{"value": "yes"}]}]})
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "non-empty" in str(e).lower()
+@requires_yaml
+def test_parse_spec_content_bytes_no_bytes_warning():
+    """parse_spec_content: Bytes input never compares bytes with str (-bb)"""
+    code = (
+        "from ask_questions import parse_spec_content; "
+        "assert parse_spec_content(b'questions: []', 'x') == {'questions': []}; "
+        "assert parse_spec_content(b' [1]', 'x') == [1]"
+    )
+    result = subprocess.run(
+        [sys.executable, "-bb", "-c", code],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
 
 
-@runner.test("parse_spec: Options not a list")
-def test_parse_spec_options_not_list():
-    try:
-        parse_spec({"questions": [{"question": "Test?", "options": "not a list"}]})
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "list" in str(e).lower()
+@requires_yaml
+def test_parse_spec_content_yaml():
+    """parse_spec_content: Valid YAML"""
+    spec = parse_spec_content("test: value", "test")
+    assert spec == {"test": "value"}, f"Expected dict, got {spec}"
 
 
-@runner.test("parse_spec: No options with explicit allow_freeform=False")
-def test_parse_spec_no_options_no_freeform():
-    # Explicitly setting allow_freeform to False with no options should error
-    try:
-        parse_spec(
-            {
-                "questions": [
-                    {"question": "Test?", "options": [], "allow_freeform": False}
-                ]
-            }
-        )
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "no options" in str(e).lower()
+def test_parse_spec_content_invalid():
+    """parse_spec_content: Invalid content"""
+    with pytest.raises(SpecError):
+        parse_spec_content("{invalid json", "test")
 
 
-@runner.test("parse_spec: Option missing value")
-def test_parse_spec_option_missing_value():
-    try:
-        parse_spec(
-            {"questions": [{"question": "Test?", "options": [{"description": "desc"}]}]}
-        )
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "value" in str(e).lower()
+@requires_yaml
+def test_parse_spec_content_yaml_error_skips_json():
+    """parse_spec_content: Non-JSON-looking content skips JSON parsing"""
+    with pytest.raises(SpecError) as excinfo:
+        parse_spec_content("test: [unclosed", "test")
+    assert "json error" not in str(excinfo.value).lower()
 
 
-@runner.test("parse_spec: Duplicate explicit keys")
-def test_parse_spec_duplicate_keys():
-    try:
-        parse_spec(
+# Tests for parse_spec validation
+def _single(**fields):
+    """Build a one-question spec, overriding the default question fields."""
+    question = {"question": "Test?", "options": [{"value": "a"}]}
+    question.update(fields)
+    return {"questions": [question]}
+
+
+@pytest.mark.parametrize(
+    "bad_spec, needle",
+    [
+        pytest.param({"other": "data"}, "'questions'", id="no_questions"),
+        pytest.param({"questions": "not a list"}, "must be a list", id="not_list"),
+        pytest.param(
+            {"questions": [{"options": [{"value": "yes"}]}]},
+            "Missing 'question'",
+            id="missing_question",
+        ),
+        pytest.param(_single(question=""), "non-empty", id="empty_question"),
+        pytest.param(
+            _single(question=123), "'question' must be a string", id="question_type"
+        ),
+        pytest.param(
+            _single(question="x" * (MAX_QUESTION_LENGTH + 1)),
+            "too long",
+            id="question_too_long",
+        ),
+        pytest.param(
+            _single(options="not a list"), "'options' must be a list", id="options_type"
+        ),
+        pytest.param(
+            _single(options=[], allow_freeform=False),
+            "no options",
+            id="no_options_no_freeform",
+        ),
+        pytest.param(
+            _single(options=[{"description": "desc"}]),
+            "missing 'value'",
+            id="option_missing_value",
+        ),
+        pytest.param(
+            _single(options=[{"value": "x" * (MAX_OPTION_LENGTH + 1)}]),
+            "too long",
+            id="option_too_long",
+        ),
+        pytest.param(
+            _single(options=[{"value": "   "}]), "non-empty", id="option_value_empty"
+        ),
+        pytest.param(
+            _single(options=[{"value": "a", "description": 123}]),
+            "'description' must be a string",
+            id="description_type",
+        ),
+        pytest.param(
+            _single(options=[], allow_freeform="true"),
+            "'allow_freeform' must be a boolean",
+            id="allow_freeform_type",
+        ),
+        pytest.param(
+            _single(options=[{"value": "a"}, {"value": "b"}], multi_select="yes"),
+            "'multi_select' must be a boolean",
+            id="multi_select_type",
+        ),
+        pytest.param(
+            _single(multi_select=True),
+            f"at least {MIN_MULTISELECT_OPTIONS}",
+            id="multi_select_min_options",
+        ),
+        pytest.param(_single(key=123), "'key' must be a string", id="key_type"),
+        pytest.param(_single(key="1invalid"), "Invalid key", id="key_leading_digit"),
+        pytest.param(_single(key="my key"), "Invalid key", id="key_space"),
+        pytest.param(_single(key="my-key"), "Invalid key", id="key_special_char"),
+        pytest.param(_single(key="key\n"), "Invalid key", id="key_trailing_newline"),
+        pytest.param(
             {
                 "questions": [
                     {"question": "Q1?", "options": [{"value": "a"}], "key": "same"},
                     {"question": "Q2?", "options": [{"value": "b"}], "key": "same"},
                 ]
-            }
-        )
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "duplicate" in str(e).lower()
-
-
-@runner.test("parse_spec: Generated key conflicts with explicit")
-def test_parse_spec_key_collision():
-    try:
-        parse_spec(
+            },
+            "Duplicate key",
+            id="duplicate_keys",
+        ),
+        pytest.param(
             {
                 "questions": [
                     {
@@ -203,37 +289,44 @@ def test_parse_spec_key_collision():
                     },
                     {"question": "Q2?", "options": [{"value": "b"}]},
                 ]
-            }
-        )
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "conflicts" in str(e).lower() or "collision" in str(e).lower()
+            },
+            "conflicts with explicit key",
+            id="generated_key_collision",
+        ),
+    ],
+)
+def test_parse_spec_rejects_invalid(bad_spec, needle):
+    """parse_spec: Invalid specs raise SpecError with a helpful message"""
+    with pytest.raises(SpecError, match=re.escape(needle)):
+        parse_spec(bad_spec)
 
 
 # Tests for valid specs
-@runner.test("parse_spec: Valid minimal spec")
-def test_parse_spec_valid_minimal():
-    questions = parse_spec(
-        {"questions": [{"question": "Test?", "options": [{"value": "yes"}]}]}
-    )
-    assert len(questions) == 1
-    assert questions[0].question == "Test?"
-    assert len(questions[0].options) == 1
-    assert questions[0].options[0].value == "yes"
+def test_parse_spec_valid_minimal(minimal_questions):
+    """parse_spec: Valid minimal spec"""
+    assert len(minimal_questions) == 1
+    assert minimal_questions[0].question == "Test?"
+    assert len(minimal_questions[0].options) == 1
+    assert minimal_questions[0].options[0].value == "yes"
 
 
-@runner.test("parse_spec: Valid with freeform only")
-def test_parse_spec_freeform_only():
-    questions = parse_spec(
-        {"questions": [{"question": "Test?", "options": [], "allow_freeform": True}]}
-    )
-    assert len(questions) == 1
-    assert questions[0].allow_freeform is True
-    assert len(questions[0].options) == 0
+def test_parse_spec_questions_immutable(minimal_questions):
+    """parse_spec: Parsed questions and options are read-only"""
+    with pytest.raises(AttributeError):
+        minimal_questions[0].key = "changed"
+    with pytest.raises(AttributeError):
+        minimal_questions[0].options[0].value = "changed"
+
+
+def test_parse_spec_freeform_only(freeform_only_questions):
+    """parse_spec: Valid with freeform only"""
+    assert len(freeform_only_questions) == 1
+    assert freeform_only_questions[0].allow_freeform is True
+    assert len(freeform_only_questions[0].options) == 0
 
 
-@runner.test("parse_spec: allow_freeform defaults to True when no options")
 def test_parse_spec_freeform_default_when_no_options():
+    """parse_spec: allow_freeform defaults to True when no options"""
     # When options is empty and allow_freeform is not specified, it should default to True
     questions = parse_spec({"questions": [{"question": "Test?", "options": []}]})
     assert len(questions) == 1
@@ -241,38 +334,17 @@ def test_parse_spec_freeform_default_when_no_options():
     assert len(questions[0].options) == 0
 
 
-@runner.test("parse_spec: allow_freeform defaults to False when options exist")
-def test_parse_spec_freeform_default_when_options_exist():
+def test_parse_spec_freeform_default_when_options_exist(minimal_questions):
+    """parse_spec: allow_freeform defaults to False when options exist"""
     # When options exist and allow_freeform is not specified, it should default to False
-    questions = parse_spec(
-        {"questions": [{"question": "Test?", "options": [{"value": "a"}]}]}
-    )
-    assert len(questions) == 1
-    assert questions[0].allow_freeform is False
-    assert len(questions[0].options) == 1
+    assert len(minimal_questions) == 1
+    assert minimal_questions[0].allow_freeform is False
+    assert len(minimal_questions[0].options) == 1
 
 
-@runner.test("parse_spec: Multiple questions with freeform-only and regular")
 def test_parse_spec_mixed_freeform_and_options():
-    questions = parse_spec(
-        {
-            "questions": [
-                {
-                    "question": "Comment?",
-                    "options": [],
-                },  # allow_freeform defaults to True
-                {
-                    "question": "Choose?",
-                    "options": [{"value": "a"}, {"value": "b"}],
-                },  # allow_freeform defaults to False
-                {
-                    "question": "Another comment?",
-                    "options": [],
-                    "key": "comment2",
-                },  # allow_freeform defaults to True
-            ]
-        }
-    )
+    """parse_spec: Multiple questions with freeform-only and regular"""
+    questions = parse_spec(_MIXED_FREEFORM_SPEC)
     assert len(questions) == 3
     # First question: freeform only
     assert questions[0].allow_freeform is True
@@ -286,8 +358,8 @@ def test_parse_spec_mixed_freeform_and_options():
     assert questions[2].key == "comment2"
 
 
-@runner.test("parse_spec: Generated keys")
 def test_parse_spec_generated_keys():
+    """parse_spec: Generated keys"""
     questions = parse_spec(
         {
             "questions": [
@@ -303,8 +375,8 @@ def test_parse_spec_generated_keys():
     assert questions[2].key == "custom"
 
 
-@runner.test("parse_spec: Custom freeform label")
 def test_parse_spec_custom_freeform_label():
+    """parse_spec: Custom freeform label"""
     questions = parse_spec(
         {
             "questions": [
@@ -320,105 +392,50 @@ def test_parse_spec_custom_freeform_label():
     assert questions[0].freeform_label == "Custom label"
 
 
-@runner.test("parse_spec: Default freeform label")
-def test_parse_spec_default_freeform_label():
-    questions = parse_spec(
-        {"questions": [{"question": "Test?", "options": [], "allow_freeform": True}]}
-    )
-    from ask_questions import DEFAULT_FREEFORM_LABEL
-
-    assert questions[0].freeform_label == DEFAULT_FREEFORM_LABEL
+def test_parse_spec_default_freeform_label(freeform_only_questions):
+    """parse_spec: Default freeform label"""
+    assert freeform_only_questions[0].freeform_label == DEFAULT_FREEFORM_LABEL
 
 
 # Tests for load_spec_from_file
-@runner.test("load_spec_from_file: Valid JSON file")
-def test_load_spec_from_file_json():
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump({"test": "value"}, f)
-        temp_path = f.name
+def test_load_spec_from_file_json(tmp_path):
+    """load_spec_from_file: Valid JSON file"""
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text(json.dumps({"test": "value"}), encoding="utf-8")
 
-    try:
-        spec = load_spec_from_file(temp_path)
-        assert spec == {"test": "value"}
-    finally:
-        Path(temp_path).unlink()
+    spec = load_spec_from_file(str(spec_path))
+    assert spec == {"test": "value"}
 
 
-@runner.test("load_spec_from_file: Valid YAML file")
-def test_load_spec_from_file_yaml():
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        f.write("test: value\n")
-        temp_path = f.name
+@requires_yaml
+def test_load_spec_from_file_yaml(tmp_path):
+    """load_spec_from_file: Valid YAML file"""
+    spec_path = tmp_path / "spec.yaml"
+    spec_path.write_text("test: value\n", encoding="utf-8")
 
-    try:
-        try:
-            spec = load_spec_from_file(temp_path)
-            assert spec == {"test": "value"}
-        except SpecError as e:
-            # YAML might not be available
-            if "pyyaml" not in str(e).lower():
-                raise
-    finally:
-        Path(temp_path).unlink()
+    spec = load_spec_from_file(str(spec_path))
+    assert spec == {"test": "value"}
 
 
-@runner.test("load_spec_from_file: File not found")
 def test_load_spec_from_file_not_found():
-    try:
+    """load_spec_from_file: File not found"""
+    with pytest.raises(SpecError, match="not found"):
         load_spec_from_file("/nonexistent/file.json")
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "not found" in str(e).lower()
 
 
-@runner.test("load_spec_from_file: Invalid JSON")
-def test_load_spec_from_file_invalid_json():
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        f.write("{invalid json")
-        temp_path = f.name
+def test_load_spec_from_file_invalid_json(tmp_path):
+    """load_spec_from_file: Invalid JSON"""
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text("{invalid json", encoding="utf-8")
 
-    try:
-        try:
-            load_spec_from_file(temp_path)
-            raise AssertionError("Should have raised SpecError")
-        except SpecError as e:
-            assert "parse" in str(e).lower() or "json" in str(e).lower()
-    finally:
-        Path(temp_path).unlink()
+    with pytest.raises(SpecError, match="as JSON"):
+        load_spec_from_file(str(spec_path))
 
 
 # Test complex realistic spec
-@runner.test("parse_spec: Complex realistic spec")
 def test_parse_spec_complex():
-    spec = {
-        "questions": [
-            {
-                "question": "What is your favorite color?",
-                "options": [
-                    {"value": "Red", "description": "The color of passion"},
-                    {"value": "Blue", "description": "The color of calm"},
-                    {"value": "Green", "description": "The color of nature"},
-                ],
-                "allow_freeform": True,
-                "freeform_label": "Other color",
-                "key": "favorite_color",
-            },
-            {
-                "question": "How many hours do you sleep?",
-                "options": [
-                    {"value": "< 6 hours"},
-                    {"value": "6-8 hours"},
-                    {"value": "> 8 hours"},
-                ],
-            },
-            {
-                "question": "Any comments?",
-                "options": [],
-            },  # allow_freeform defaults to True
-        ]
-    }
-
-    questions = parse_spec(spec)
+    """parse_spec: Complex realistic spec"""
+    questions = parse_spec(_COMPLEX_SPEC)
     assert len(questions) == 3
     assert questions[0].question == "What is your favorite color?"
     assert len(questions[0].options) == 3
@@ -440,113 +457,36 @@ def test_parse_spec_complex():
 # Tests for new validations (Recommendations)
 
 
-@runner.test("parse_spec: Whitespace normalized in question text (Rec 4)")
 def test_parse_spec_question_whitespace_normalized():
+    """parse_spec: Whitespace normalized in question text (Rec 4)"""
     questions = parse_spec(
         {"questions": [{"question": "  Test?  ", "options": [{"value": "a"}]}]}
     )
     assert questions[0].question == "Test?"
 
 
-@runner.test("parse_spec: Question text too long (Rec 9)")
-def test_parse_spec_question_too_long():
-    long_question = "x" * (MAX_QUESTION_LENGTH + 1)
-    try:
-        parse_spec(
-            {"questions": [{"question": long_question, "options": [{"value": "a"}]}]}
-        )
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "too long" in str(e).lower()
-
-
-@runner.test("parse_spec: Option value too long (Rec 9)")
-def test_parse_spec_option_too_long():
-    long_value = "x" * (MAX_OPTION_LENGTH + 1)
-    try:
-        parse_spec(
-            {"questions": [{"question": "Test?", "options": [{"value": long_value}]}]}
-        )
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "too long" in str(e).lower()
-
-
-@runner.test("parse_spec: Option value must be non-empty (trimmed)")
-def test_parse_spec_option_value_non_empty():
-    try:
-        parse_spec(
-            {"questions": [{"question": "Test?", "options": [{"value": "   "}]}]}
-        )
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "non-empty" in str(e).lower()
-
-
-@runner.test("parse_spec: Too many questions (Rec 12)")
 def test_parse_spec_too_many_questions():
-    questions = [
-        {"question": f"Q{i}?", "options": [{"value": "a"}]}
-        for i in range(MAX_QUESTIONS + 1)
-    ]
-    try:
-        parse_spec({"questions": questions})
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "too many" in str(e).lower()
-
+    """parse_spec: Too many questions (Rec 12)"""
+    with pytest.raises(SpecError, match="Too many questions"):
+        parse_spec({"questions": _TOO_MANY_QUESTIONS})
 
-@runner.test("parse_spec: Invalid key format - starts with number (Rec 15)")
-def test_parse_spec_invalid_key_starts_with_number():
-    try:
-        parse_spec(
-            {
-                "questions": [
-                    {
-                        "question": "Test?",
-                        "options": [{"value": "a"}],
-                        "key": "1invalid",
-                    }
-                ]
-            }
-        )
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "invalid key" in str(e).lower()
-
-
-@runner.test("parse_spec: Invalid key format - contains spaces (Rec 15)")
-def test_parse_spec_invalid_key_spaces():
-    try:
-        parse_spec(
-            {
-                "questions": [
-                    {"question": "Test?", "options": [{"value": "a"}], "key": "my key"}
-                ]
-            }
-        )
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "invalid key" in str(e).lower()
 
-
-@runner.test("parse_spec: Invalid key format - contains special chars (Rec 15)")
-def test_parse_spec_invalid_key_special_chars():
-    try:
-        parse_spec(
-            {
-                "questions": [
-                    {"question": "Test?", "options": [{"value": "a"}], "key": "my-key"}
-                ]
-            }
-        )
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "invalid key" in str(e).lower()
+def test_parse_spec_key_validation_matches_pattern():
+    """parse_spec: Key validation agrees with KEY_PATTERN (Rec 15)"""
+    for key in ["a", "_", "A1_b", "1a", "a-b", "a b", "", "café", "ａ", "__init__"]:
+        spec = {
+            "questions": [{"question": "Q?", "options": [{"value": "a"}], "key": key}]
+        }
+        try:
+            parse_spec(spec)
+            accepted = True
+        except SpecError:
+            accepted = False
+        assert accepted == bool(KEY_PATTERN.fullmatch(key)), f"Mismatch for {key!r}"
 
 
-@runner.test("parse_spec: Valid key formats (Rec 15)")
 def test_parse_spec_valid_key_formats():
+    """parse_spec: Valid key formats (Rec 15)"""
     questions = parse_spec(
         {
             "questions": [
@@ -565,113 +505,15 @@ def test_parse_spec_valid_key_formats():
     assert questions[2].key == "camelCase123"
 
 
-@runner.test("parse_spec: Key must be string (Rec 15)")
-def test_parse_spec_key_must_be_string():
-    try:
-        parse_spec(
-            {
-                "questions": [
-                    {"question": "Test?", "options": [{"value": "a"}], "key": 123}
-                ]
-            }
-        )
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "'key' must be a string" in str(e).lower()
-
-
-@runner.test("parse_spec: Description must be string (Rec 16)")
-def test_parse_spec_description_must_be_string():
-    try:
-        parse_spec(
-            {
-                "questions": [
-                    {
-                        "question": "Test?",
-                        "options": [{"value": "a", "description": 123}],
-                    }
-                ]
-            }
-        )
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "'description' must be a string" in str(e).lower()
+@pytest.mark.parametrize("label", ["", "   ", 123], ids=["empty", "blank", "int"])
+def test_parse_spec_freeform_label_validated(label):
+    """parse_spec: freeform_label validated (Rec 6)"""
+    with pytest.raises(SpecError, match="'freeform_label' must be a non-empty string"):
+        parse_spec(_single(options=[], allow_freeform=True, freeform_label=label))
 
 
-@runner.test("parse_spec: allow_freeform must be boolean (Rec 7)")
-def test_parse_spec_allow_freeform_must_be_boolean():
-    try:
-        parse_spec(
-            {
-                "questions": [
-                    {"question": "Test?", "options": [], "allow_freeform": "true"}
-                ]
-            }
-        )
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "'allow_freeform' must be a boolean" in str(e).lower()
-
-
-@runner.test("parse_spec: freeform_label validated (Rec 6)")
-def test_parse_spec_freeform_label_validated():
-    # Empty string should fail
-    try:
-        parse_spec(
-            {
-                "questions": [
-                    {
-                        "question": "Test?",
-                        "options": [],
-                        "allow_freeform": True,
-                        "freeform_label": "",
-                    }
-                ]
-            }
-        )
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "'freeform_label' must be a non-empty string" in str(e).lower()
-
-    # Only whitespace should fail
-    try:
-        parse_spec(
-            {
-                "questions": [
-                    {
-                        "question": "Test?",
-                        "options": [],
-                        "allow_freeform": True,
-                        "freeform_label": "   ",
-                    }
-                ]
-            }
-        )
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "'freeform_label' must be a non-empty string" in str(e).lower()
-
-    # Non-string should fail
-    try:
-        parse_spec(
-            {
-                "questions": [
-                    {
-                        "question": "Test?",
-                        "options": [],
-                        "allow_freeform": True,
-                        "freeform_label": 123,
-                    }
-                ]
-            }
-        )
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "'freeform_label' must be a non-empty string" in str(e).lower()
-
-
-@runner.test("parse_spec: freeform_label whitespace stripped (Rec 6)")
 def test_parse_spec_freeform_label_stripped():
+    """parse_spec: freeform_label whitespace stripped (Rec 6)"""
     questions = parse_spec(
         {
             "questions": [
@@ -687,20 +529,11 @@ def test_parse_spec_freeform_label_stripped():
     assert questions[0].freeform_label == "Custom"
 
 
-@runner.test("parse_spec: Question text must be string type")
-def test_parse_spec_question_must_be_string():
-    try:
-        parse_spec({"questions": [{"question": 123, "options": [{"value": "a"}]}]})
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "'question' must be a string" in str(e).lower()
-
-
 # Tests for multi_select feature
 
 
-@runner.test("parse_spec: Valid multi_select with enough options")
 def test_parse_spec_multiselect_valid():
+    """parse_spec: Valid multi_select with enough options"""
     questions = parse_spec(
         {
             "questions": [
@@ -717,76 +550,19 @@ def test_parse_spec_multiselect_valid():
     assert len(questions[0].options) == 3
 
 
-@runner.test("parse_spec: multi_select defaults to False")
-def test_parse_spec_multiselect_default():
-    questions = parse_spec(
-        {"questions": [{"question": "Test?", "options": [{"value": "a"}]}]}
-    )
-    assert questions[0].multi_select is False
-
-
-@runner.test("parse_spec: multi_select must be boolean")
-def test_parse_spec_multiselect_must_be_boolean():
-    try:
-        parse_spec(
-            {
-                "questions": [
-                    {
-                        "question": "Test?",
-                        "options": [{"value": "a"}, {"value": "b"}],
-                        "multi_select": "yes",
-                    }
-                ]
-            }
-        )
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert "'multi_select' must be a boolean" in str(e)
-
-
-@runner.test("parse_spec: multi_select requires minimum options")
-def test_parse_spec_multiselect_min_options():
-    try:
-        parse_spec(
-            {
-                "questions": [
-                    {
-                        "question": "Test?",
-                        "options": [{"value": "a"}],  # Only 1 option
-                        "multi_select": True,
-                    }
-                ]
-            }
-        )
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert f"at least {MIN_MULTISELECT_OPTIONS}" in str(e)
+def test_parse_spec_multiselect_default(minimal_questions):
+    """parse_spec: multi_select defaults to False"""
+    assert minimal_questions[0].multi_select is False
 
 
-@runner.test("parse_spec: multi_select enforces maximum options")
 def test_parse_spec_multiselect_max_options():
-    too_many_options = [
-        {"value": f"opt{i}"} for i in range(MAX_MULTISELECT_OPTIONS + 1)
-    ]
-    try:
-        parse_spec(
-            {
-                "questions": [
-                    {
-                        "question": "Test?",
-                        "options": too_many_options,
-                        "multi_select": True,
-                    }
-                ]
-            }
-        )
-        raise AssertionError("Should have raised SpecError")
-    except SpecError as e:
-        assert f"at most {MAX_MULTISELECT_OPTIONS}" in str(e)
+    """parse_spec: multi_select enforces maximum options"""
+    with pytest.raises(SpecError, match=f"at most {MAX_MULTISELECT_OPTIONS}"):
+        parse_spec(_single(options=_TOO_MANY_OPTIONS, multi_select=True))
 
 
-@runner.test("parse_spec: multi_select with allow_freeform")
 def test_parse_spec_multiselect_with_freeform():
+    """parse_spec: multi_select with allow_freeform"""
     questions = parse_spec(
         {
             "questions": [
@@ -805,8 +581,8 @@ def test_parse_spec_multiselect_with_freeform():
     assert questions[0].freeform_label == "Other feature"
 
 
-@runner.test("parse_spec: multi_select without allow_freeform")
 def test_parse_spec_multiselect_without_freeform():
+    """parse_spec: multi_select without allow_freeform"""
     questions = parse_spec(
         {
             "questions": [
@@ -823,8 +599,8 @@ def test_parse_spec_multiselect_without_freeform():
     assert questions[0].allow_freeform is False
 
 
-@runner.test("parse_spec: multi_select at boundary (min options)")
 def test_parse_spec_multiselect_min_boundary():
+    """parse_spec: multi_select at boundary (min options)"""
     questions = parse_spec(
         {
             "questions": [
@@ -842,8 +618,8 @@ def test_parse_spec_multiselect_min_boundary():
     assert len(questions[0].options) == MIN_MULTISELECT_OPTIONS
 
 
-@runner.test("parse_spec: multi_select at boundary (max options)")
 def test_parse_spec_multiselect_max_boundary():
+    """parse_spec: multi_select at boundary (max options)"""
     questions = parse_spec(
         {
             "questions": [
@@ -861,31 +637,9 @@ def test_parse_spec_multiselect_max_boundary():
     assert len(questions[0].options) == MAX_MULTISELECT_OPTIONS
 
 
-@runner.test("parse_spec: Complex spec with mixed single and multi_select")
 def test_parse_spec_mixed_single_and_multiselect():
-    questions = parse_spec(
-        {
-            "questions": [
-                {
-                    "question": "Single select?",
-                    "options": [{"value": "a"}],
-                    "key": "single",
-                },
-                {
-                    "question": "Multi select?",
-                    "options": [{"value": "x"}, {"value": "y"}, {"value": "z"}],
-                    "multi_select": True,
-                    "allow_freeform": True,
-                    "key": "multi",
-                },
-                {
-                    "question": "Freeform only?",
-                    "options": [],
-                    "key": "freeform",
-                },
-            ]
-        }
-    )
+    """parse_spec: Complex spec with mixed single and multi_select"""
+    questions = parse_spec(_MIXED_SELECT_SPEC)
     assert len(questions) == 3
     assert questions[0].multi_select is False
     assert questions[1].multi_select is True
@@ -894,8 +648,8 @@ def test_parse_spec_mixed_single_and_multiselect():
     assert questions[2].allow_freeform is True
 
 
-@runner.test("schema: Matches runtime defaults for freeform-only")
 def test_schema_allows_freeform_only_by_default():
+    """schema: Matches runtime defaults for freeform-only"""
     schema = get_spec_json_schema()
     question_schema = schema["properties"]["questions"]["items"]
     assert "allOf" in question_schema, "Expected schema to use allOf rules"
@@ -919,8 +673,8 @@ def test_schema_allows_freeform_only_by_default():
     ), "Schema should not force allow_freeform for empty options"
 
 
-@runner.test("schema: Enforces multi_select option bounds")
 def test_schema_enforces_multiselect_bounds():
+    """schema: Enforces multi_select option bounds"""
     schema = get_spec_json_schema()
     question_schema = schema["properties"]["questions"]["items"]
     found_multiselect_rule = False
@@ -937,5 +691,338 @@ def test_schema_enforces_multiselect_bounds():
     assert found_multiselect_rule, "Missing multi_select=true option bounds rule"
 
 
-if __name__ == "__main__":
-    sys.exit(runner.run())
+def test_schema_is_cached():
+    """schema: Built once and reused"""
+    assert get_spec_json_schema() is get_spec_json_schema()
+
+
+@requires_yaml
+def test_example_yaml_matches_example_spec():
+    """example: YAML example matches the JSON example"""
+    spec = parse_spec_content(get_example_yaml(), "example")
+    assert spec == get_example_spec()
+    assert len(parse_spec(spec)) == len(spec["questions"])
+
+
+# Tests for ask_questions, driven by a scripted stand-in for questionary
+class _StubPrompt:
+    def __init__(self, answer):
+        self._answer = answer
+
+    def ask(self):
+        return self._answer
+
+
+@pytest.fixture
+def scripted_answers(monkeypatch):
+    """Install a fake questionary whose prompts return queued answers."""
+    replies = []
+
+    def prompt(*args, **kwargs):
+        return _StubPrompt(replies.pop(0))
+
+    stub = types.SimpleNamespace(
+        Style=lambda rules: None,
+        Choice=lambda title, value: value,
+        text=prompt,
+        select=prompt,
+        checkbox=prompt,
+    )
+    monkeypatch.setitem(_LAZY_MODULES, "questionary", stub)
+    return replies
+
+
+def test_ask_questions_on_answer(scripted_answers):
+    """ask_questions: on_answer fires per answer, in order, with the output key"""
+    scripted_answers.extend(["first", "b", "second"])
+    calls = []
+
+    answers, was_cancelled = ask_questions(
+        parse_spec(_MIXED_FREEFORM_SPEC),
+        on_answer=lambda key, answer: calls.append((key, answer)),
+    )
+
+    assert calls == [
+        ("question_0", "first"),
+        ("question_1", "b"),
+        ("comment2", "second"),
+    ]
+    assert answers == dict(calls)
+    assert was_cancelled is False
+
+
+def test_main_stream(tmp_path, monkeypatch, capsys, scripted_answers):
+    """main: --stream writes one compact JSON line per answer and nothing else"""
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text(json.dumps(_MIXED_SELECT_SPEC))
+    scripted_answers.extend(["a", ["x", "z"], "notes"])
+    monkeypatch.setattr(os, "isatty", lambda fd: True)
+    monkeypatch.setattr(
+        sys, "argv", ["ask_questions.py", "--spec", str(spec_path), "--stream"]
+    )
+
+    main()
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"single": "a"},
+        {"multi": ["x", "z"]},
+        {"freeform": "notes"},
+    ]
+
+
+class _ClosedPipe:
+    """stdout whose reader has gone away; fileno() is a scratch file."""
+
+    def __init__(self, fd):
+        self._fd = fd
+        self.buffer = self
+
+    def write(self, data):
+        raise BrokenPipeError(32, "Broken pipe")
+
+    def flush(self):
+        pass
+
+    def fileno(self):
+        return self._fd
+
+
+@contextlib.contextmanager
+def _fake_tty(tty_device):
+    yield None, None
+
+
+@pytest.mark.parametrize("stdin_is_tty", [True, False], ids=["stdin", "tty_device"])
+def test_main_stream_broken_pipe(
+    tmp_path, monkeypatch, capsys, scripted_answers, stdin_is_tty
+):
+    """main: --stream exits cleanly when the reader closes stdout"""
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text(json.dumps(_MIXED_SELECT_SPEC))
+    scripted_answers.extend(["a", ["x", "z"], "notes"])
+    monkeypatch.setattr(os, "isatty", lambda fd: stdin_is_tty)
+    monkeypatch.setattr("ask_questions._open_tty", _fake_tty)
+    monkeypatch.setattr("prompt_toolkit.input.create_input", lambda stdin: None)
+    monkeypatch.setattr("prompt_toolkit.output.create_output", lambda stdout: None)
+    monkeypatch.setattr(
+        sys, "argv", ["ask_questions.py", "--spec", str(spec_path), "--stream"]
+    )
+
+    stdout_fd = os.open(tmp_path / "stdout", os.O_WRONLY | os.O_CREAT)
+    # Swapped in here rather than in a fixture, which capsys would undo
+    monkeypatch.setattr(sys, "stdout", _ClosedPipe(stdout_fd))
+    try:
+        with pytest.raises(SystemExit) as excinfo:
+            main()
+    finally:
+        os.close(stdout_fd)
+
+    assert excinfo.value.code == 1
+    # Stopped at the first answer, without blaming the terminal device
+    assert scripted_answers == [["x", "z"], "notes"]
+    assert capsys.readouterr().err == ""
+
+
+def test_main_tty_open_error(tmp_path, monkeypatch, capsys, scripted_answers):
+    """main: failing to open the terminal device is reported as such"""
+
+    def no_tty(tty_device):
+        raise OSError(6, "No such device or address")
+
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text(json.dumps(_MIXED_SELECT_SPEC))
+    monkeypatch.setattr(os, "isatty", lambda fd: False)
+    monkeypatch.setattr("ask_questions._open_tty", no_tty)
+    monkeypatch.setattr(sys, "argv", ["ask_questions.py", "--spec", str(spec_path)])
+
+    with pytest.raises(SystemExit) as excinfo:
+        main()
+
+    assert excinfo.value.code == 1
+    assert "Cannot open" in capsys.readouterr().err
+
+
+# Tests for JSON output
+_NON_ASCII_ANSWERS = {
+    "choice": "Café ☕",
+    "features": ["Ä", "b"],
+    "empty": [],
+    "n": "日本",
+}
+
+
+@pytest.mark.parametrize("pretty", [False, True], ids=["compact", "pretty"])
+def test_dump_json_stdlib_matches_json_dumps(monkeypatch, pretty):
+    """output: Without orjson, output is exactly json.dumps plus a newline"""
+    monkeypatch.setattr("ask_questions.orjson", None)
+    expected = json.dumps(_NON_ASCII_ANSWERS, indent=2 if pretty else None) + "\n"
+
+    output = _dump_json(_NON_ASCII_ANSWERS, pretty)
+
+    assert output == expected
+    assert output.isascii()
+
+
+@pytest.mark.parametrize("pretty", [False, True], ids=["compact", "pretty"])
+def test_dump_json_orjson_same_data(pretty):
+    """output: With orjson, output decodes to the same data"""
+    pytest.importorskip("orjson")
+    output = _dump_json(_NON_ASCII_ANSWERS, pretty)
+    assert output.endswith(b"\n")
+    assert json.loads(output) == _NON_ASCII_ANSWERS
+
+
+@pytest.fixture
+def stdlib_json(monkeypatch):
+    """Serialize with the stdlib fallback, as when orjson is not installed."""
+    monkeypatch.setattr("ask_questions.orjson", None)
+    _schema_json.cache_clear()
+    yield
+    _schema_json.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "argv, build, indent",
+    [
+        (["--schema"], get_spec_json_schema, None),
+        (["--schema", "--pretty"], get_spec_json_schema, 2),
+        (["--example", "json"], get_example_spec, None),
+        (["--example", "json", "--pretty"], get_example_spec, 2),
+    ],
+    ids=["schema", "schema_pretty", "example_json", "example_json_pretty"],
+)
+def test_main_json_utilities_match_json_dumps(
+    stdlib_json, monkeypatch, capsys, argv, build, indent
+):
+    """main: --schema/--example json print exactly json.dumps without orjson"""
+    monkeypatch.setattr(sys, "argv", ["ask_questions.py", *argv])
+
+    with pytest.raises(SystemExit) as excinfo:
+        main()
+
+    assert excinfo.value.code == 0
+    assert capsys.readouterr().out == json.dumps(build(), indent=indent) + "\n"
+
+
+# Tests for the command line
+def test_main_dry_run_batch(tmp_path, monkeypatch, capsys):
+    """main: --dry-run reports each spec and fails if any is invalid"""
+    good = tmp_path / "good.json"
+    good.write_text(json.dumps({"questions": [{"question": "Q?"}]}))
+    bad = tmp_path / "bad.json"
+    bad.write_text(json.dumps({"questions": "not a list"}))
+    monkeypatch.setattr(
+        sys, "argv", ["ask_questions.py", "--spec", str(good), str(bad), "--dry-run"]
+    )
+
+    with pytest.raises(SystemExit) as excinfo:
+        main()
+
+    assert excinfo.value.code == 1
+    assert capsys.readouterr().err.splitlines() == [
+        f"{good}: Valid spec with 1 questions",
+        f"{bad}: Error: 'questions' must be a list",
+    ]
+
+
+def test_main_dry_run_batch_all_valid(tmp_path, monkeypatch, capsys):
+    """main: --dry-run exits 0 when every spec is valid"""
+    paths = []
+    for name in ("a.json", "b.json"):
+        path = tmp_path / name
+        path.write_text(json.dumps({"questions": [{"question": "Q?"}]}))
+        paths.append(str(path))
+    monkeypatch.setattr(
+        sys, "argv", ["ask_questions.py", "--spec", *paths, "--dry-run"]
+    )
+
+    with pytest.raises(SystemExit) as excinfo:
+        main()
+
+    assert excinfo.value.code == 0
+    assert len(capsys.readouterr().err.splitlines()) == 2
+
+
+def test_main_multiple_specs_require_dry_run(monkeypatch, capsys):
+    """main: Several --spec files without --dry-run is a usage error"""
+    monkeypatch.setattr(sys, "argv", ["ask_questions.py", "--spec", "a.json", "b.json"])
+
+    with pytest.raises(SystemExit) as excinfo:
+        main()
+
+    assert excinfo.value.code == 2
+    assert "only be used together with --dry-run" in capsys.readouterr().err
+
+
+def _run_main_bytes(monkeypatch, capsysbinary, argv):
+    """Run main() with argv, expect exit 0 and return the stdout bytes."""
+    monkeypatch.setattr(sys, "argv", ["ask_questions.py", *argv])
+    with pytest.raises(SystemExit) as excinfo:
+        main()
+    assert excinfo.value.code == 0
+    return capsysbinary.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "fast_argv, parsed_argv",
+    [
+        (["--schema"], ["--sch"]),
+        (["--schema", "--pretty"], ["--sch", "--pretty"]),
+        (["--pretty", "--schema"], ["--pretty", "--sch"]),
+        (["--example", "yaml"], ["--example=yaml"]),
+    ],
+    ids=["schema", "schema_pretty", "pretty_schema", "example_yaml"],
+)
+def test_main_fast_path_matches_argparse(
+    monkeypatch, capsysbinary, fast_argv, parsed_argv
+):
+    """main: argv fast path writes the same bytes as the argparse path"""
+    # The abbreviated/joined spellings are only understood by argparse, so
+    # they exercise the full parser for the same request.
+    fast = _run_main_bytes(monkeypatch, capsysbinary, fast_argv)
+    parsed = _run_main_bytes(monkeypatch, capsysbinary, parsed_argv)
+
+    assert fast == parsed
+    if fast_argv == ["--example", "yaml"]:
+        assert fast == get_example_yaml().encode()
+    else:
+        assert json.loads(fast) == get_spec_json_schema()
+        expected = _schema_json("--pretty" in fast_argv)
+        if isinstance(expected, str):
+            expected = expected.encode()
+        assert fast == expected
+
+
+def test_main_stdin_spec_only_once(monkeypatch, capsys):
+    """main: '-' may appear only once among several --spec sources"""
+    monkeypatch.setattr(
+        sys, "argv", ["ask_questions.py", "--spec", "-", "-", "--dry-run"]
+    )
+
+    with pytest.raises(SystemExit) as excinfo:
+        main()
+
+    assert excinfo.value.code == 2
+    assert "can only be given once" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [["--schema", "--dry-run"], ["--example", "json"], ["--spec", "SPEC", "--dry-run"]],
+    ids=["usage_error", "example", "dry_run"],
+)
+def test_main_early_exits_skip_tty_probe(tmp_path, monkeypatch, argv):
+    """main: Non-interactive exits never probe stdin for a TTY"""
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text(json.dumps({"questions": [{"question": "Q?"}]}))
+    argv = [str(spec_path) if arg == "SPEC" else arg for arg in argv]
+
+    def fail_isatty(fd):
+        raise AssertionError("stdin was probed")
+
+    monkeypatch.setattr(os, "isatty", fail_isatty)
+    monkeypatch.setattr(sys, "argv", ["ask_questions.py", *argv])
+
+    with pytest.raises(SystemExit):
+        main()